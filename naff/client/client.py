@@ -1017,6 +1017,18 @@ class Client(
             else:
                 raise ValueError(f"Duplicate Component! Multiple component callbacks for `{listener}`")
 
+    def remove_component_callback(self, command: ComponentCommand) -> None:
+        """
+        Remove a component callback from the client.
+
+        Args:
+            command: The command to remove
+
+        """
+        for listener in command.listeners:
+            if self._component_callbacks.get(listener) is command:
+                del self._component_callbacks[listener]
+
     def add_modal_callback(self, command: ModalCommand) -> None:
         """
         Add a modal callback to the client.
@@ -1,7 +1,11 @@
 import asyncio
-import textwrap
-import uuid
-from typing import List, TYPE_CHECKING, Optional, Callable, Coroutine, Union
+import copy
+import heapq
+import itertools
+import secrets
+from typing import Any, List, TYPE_CHECKING, Optional, Callable, Coroutine, Union, ClassVar
+
+import attrs
 
 from naff import (
     Embed,
@@ -9,7 +13,7 @@ from naff import (
     ActionRow,
     Button,
     ButtonStyles,
-    spread_to_rows,
+    ComponentTypes,
     ComponentCommand,
     Context,
     PrefixedContext,
@@ -21,8 +25,10 @@ from naff import (
     Color,
     BrandColors,
 )
+from naff.client.errors import Forbidden, NotFound
 from naff.client.utils.attr_utils import define, field
 from naff.client.utils.serializer import export_converter
+from naff.models.discord.color import process_color
 from naff.models.discord.emoji import process_emoji
 
 if TYPE_CHECKING:
@@ -32,28 +38,16 @@ if TYPE_CHECKING:
 __all__ = ("Paginator",)
 
 
-@define(kw_only=False)
-class Timeout:
-    paginator: "Paginator" = field()
-    """The paginator that this timeout is associated with."""
-    run: bool = field(default=True)
-    """Whether or not this timeout is currently running."""
-    ping: asyncio.Event = asyncio.Event()
-    """The event that is used to wait the paginator action."""
-
-    async def __call__(self) -> None:
-        while self.run:
-            try:
-                await asyncio.wait_for(self.ping.wait(), timeout=self.paginator.timeout_interval)
-            except asyncio.TimeoutError:
-                if self.paginator.message:
-                    await self.paginator.message.edit(components=self.paginator.create_components(True))
-                return
-            else:
-                self.ping.clear()
+def _invalidate_page_cache(instance: "Page", attribute: attrs.Attribute, value: Any) -> Any:
+    """An `on_setattr` hook that drops the page's cached output when its content changes."""
+    if not attribute.name.startswith("_"):
+        instance._summary = None
+        Page._revision += 1
+        instance._embed_dict_cache.clear()
+    return value
 
 
-@define(kw_only=False)
+@define(kw_only=False, on_setattr=_invalidate_page_cache)
 class Page:
     content: str = field()
     """The content of the page."""
@@ -63,18 +57,134 @@ class Page:
     """Content that is prepended to the page."""
     suffix: str = field(kw_only=True, default="")
     """Content that is appended to the page."""
+    _summary: Optional[str] = field(default=None, init=False)
+    _embed_dict_cache: dict[tuple[Optional[str], Optional[int]], dict] = field(factory=dict, init=False)
+
+    _revision: ClassVar[int] = 0
+    """Incremented whenever any page is edited, so paginators know to rebuild output derived from their pages"""
 
     @property
     def get_summary(self) -> str:
         """Get the short version of the page content."""
-        return self.title or textwrap.shorten(self.content, 40, placeholder="...")
+        if self._summary is None:
+            if self.title:
+                self._summary = self.title
+            else:
+                content = " ".join(self.content.split())
+                self._summary = content if len(content) <= 40 else f"{content[:37]}..."
+        return self._summary
 
     def to_embed(self) -> Embed:
         """Process the page to an embed."""
         return Embed(description=f"{self.prefix}\n{self.content}\n{self.suffix}", title=self.title)
 
+    def to_embed_dict(self, default_title: Optional[str] = None, default_color: Optional[Color] = None) -> dict:
+        """
+        Process the page to a serialised embed, reusing the result of previous calls with the same defaults.
+
+        Args:
+            default_title: The title to use if this page has none
+            default_color: The colour to give the embed
 
-@define(kw_only=False)
+        Returns:
+            The embed dictionary. This is shared between calls, so copy it before modifying it.
+        """
+        # `Color` compares by identity, so key on the value that is actually sent
+        key = (default_title, process_color(default_color))
+        if (data := self._embed_dict_cache.get(key)) is None:
+            embed = self.to_embed()
+            if not embed.title and default_title:
+                embed.title = default_title
+            if default_color:
+                embed.color = default_color
+            data = self._embed_dict_cache[key] = embed.to_dict()
+        return data
+
+
+_EMOJI_META = export_converter(process_emoji)
+_DEFAULT_EMOJI_DICTS: dict[str, dict] = {emoji: process_emoji(emoji) for emoji in ("⏮️", "⬅️", "➡️", "⏩", "✅")}
+"""The default button emojis, converted once and keyed by emoji. Only used internally, never handed to callers"""
+
+
+def _process_button_emoji(emoji: Optional[Union["PartialEmoji", dict, str]]) -> Optional[dict]:
+    """Convert a button emoji for the payload, reusing the shared dict for the default emojis."""
+    if isinstance(emoji, str) and (data := _DEFAULT_EMOJI_DICTS.get(emoji)) is not None:
+        return data
+    return process_emoji(emoji)
+
+
+_ID_PREFIX = secrets.token_hex(4)
+"""Distinguishes paginator ids from those handed out by previous runs of the bot"""
+_id_counter = itertools.count()
+
+
+def _next_id() -> str:
+    """Get a short paginator id that is unique within this process."""
+    return f"{_ID_PREFIX}{next(_id_counter):x}"
+
+
+def _chunk_string(content: str, width: int) -> list[str]:
+    """
+    Split a string into chunks of at most `width` characters, preferring to break on whitespace.
+
+    Args:
+        content: The string to split
+        width: The maximum length of each chunk
+
+    Returns:
+        The chunks, with surrounding whitespace stripped
+
+    Raises:
+        ValueError: If `width` is less than 1
+    """
+    if width < 1:
+        raise ValueError(f"Invalid chunk width {width}, must be at least 1")
+
+    chunks = []
+    start = 0
+    end = len(content)
+    while start < end:
+        if content[start].isspace():
+            start += 1
+            continue
+        stop = start + width
+        if stop >= end:
+            chunks.append(content[start:].rstrip())
+            break
+        cut = stop
+        while cut > start and not content[cut].isspace():
+            cut -= 1
+        if cut == start:
+            cut = stop
+        chunks.append(content[start:cut].rstrip())
+        start = cut
+    return [c for c in chunks if c]
+
+
+def _invalidate_cache(instance: "Paginator", attribute: attrs.Attribute, value: Any) -> Any:
+    """An `on_setattr` hook that drops the paginator's render caches when a displayed attribute changes."""
+    if attribute.name != "page_index" and not attribute.name.startswith("_"):
+        instance._components_dict_cache.clear()
+        if attribute.name.endswith("_button_emoji"):
+            instance._emoji_dicts[attribute.name.removesuffix("_button_emoji")] = _process_button_emoji(value)
+        if attribute.name == "pages":
+            instance._select_options = None
+            instance._select_option_dicts = None
+            instance._last = len(value) - 1
+    return value
+
+
+_PAGE_ACTIONS: dict[str, Callable[["Paginator", ComponentContext], int]] = {
+    "first": lambda p, ctx: 0,
+    "last": lambda p, ctx: p._last,
+    "next": lambda p, ctx: min(p.page_index + 1, p._last),
+    "back": lambda p, ctx: max(p.page_index - 1, 0),
+    "select": lambda p, ctx: int(ctx.values[0]),
+}
+"""Maps a navigation custom_id suffix to the page index it moves a paginator to"""
+
+
+@define(kw_only=False, on_setattr=_invalidate_cache)
 class Paginator:
     client: "Client" = field()
     """The NAFF client to hook listeners into"""
@@ -82,7 +192,7 @@ class Paginator:
     page_index: int = field(kw_only=True, default=0)
     """The index of the current page being displayed"""
     pages: List[Page | Embed] = field(factory=list, kw_only=True)
-    """The pages this paginator holds"""
+    """The pages this paginator holds. Reassign this after adding or removing pages, or editing `Embed` pages"""
     timeout_interval: int = field(default=0, kw_only=True)
     """How long until this paginator disables itself"""
     callback: Callable[..., Coroutine] = field(default=None)
@@ -101,25 +211,15 @@ class Paginator:
     show_select_menu: bool = field(default=False)
     """Should a select menu be shown for navigation"""
 
-    first_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(
-        default="⏮️", metadata=export_converter(process_emoji)
-    )
+    first_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(default="⏮️", metadata=_EMOJI_META)
     """The emoji to use for the first button"""
-    back_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(
-        default="⬅️", metadata=export_converter(process_emoji)
-    )
+    back_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(default="⬅️", metadata=_EMOJI_META)
     """The emoji to use for the back button"""
-    next_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(
-        default="➡️", metadata=export_converter(process_emoji)
-    )
+    next_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(default="➡️", metadata=_EMOJI_META)
     """The emoji to use for the next button"""
-    last_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(
-        default="⏩", metadata=export_converter(process_emoji)
-    )
+    last_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(default="⏩", metadata=_EMOJI_META)
     """The emoji to use for the last button"""
-    callback_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(
-        default="✅", metadata=export_converter(process_emoji)
-    )
+    callback_button_emoji: Optional[Union["PartialEmoji", dict, str]] = field(default="✅", metadata=_EMOJI_META)
     """The emoji to use for the callback button"""
 
     wrong_user_message: str = field(default="This paginator is not for you")
@@ -132,26 +232,50 @@ class Paginator:
     default_button_color: Union[ButtonStyles, int] = field(default=ButtonStyles.BLURPLE)
     """The color of the buttons"""
 
-    _uuid: str = field(factory=uuid.uuid4)
+    _uuid: str = field(factory=_next_id)
     _message: Message = field(default=MISSING)
-    _timeout_task: Timeout = field(default=MISSING)
     _author_id: Snowflake_Type = field(default=MISSING)
+    _deadline: Optional[float] = field(default=None)
+    _expiry_entry: Optional[int] = field(default=None)
+    _components_dict_cache: dict[tuple[int, bool], list[dict]] = field(factory=dict, init=False)
+    _select_options: Optional[List[SelectOption]] = field(default=None, init=False)
+    _select_option_dicts: Optional[list[dict]] = field(default=None, init=False)
+    _emoji_dicts: dict[str, Optional[dict]] = field(factory=dict, init=False)
+    _last: int = field(default=0, init=False)
+    _cid_prefix: str = field(default="", init=False)
+    _editing: bool = field(default=False, init=False)
+    _pending_ctx: Optional[ComponentContext] = field(default=None, init=False)
+    _command: Optional[ComponentCommand] = field(default=None, init=False)
+    _page_revision: int = field(default=0, init=False)
+
+    _expiry_heap: ClassVar[list[tuple[float, int, "Paginator"]]] = []
+    """A heap of `(deadline, entry, paginator)` shared by all paginators with a timeout"""
+    _expiry_handle: ClassVar[Optional[asyncio.TimerHandle]] = None
+    """The single timer that fires when the earliest deadline in the heap is reached"""
+    _expiry_counter: ClassVar[itertools.count] = itertools.count()
+    _disable_tasks: ClassVar[set[asyncio.Task]] = set()
+    """Strong references to in-flight expiry edits, so they aren't garbage collected mid-run"""
+    _registry: ClassVar[dict[str, "Paginator"]] = {}
+    """Live paginators, keyed by the id prefix of their custom_ids"""
 
     def __attrs_post_init__(self) -> None:
-        self.client.add_component_callback(
-            ComponentCommand(
-                name=f"Paginator:{self._uuid}",
-                callback=self._on_button,
-                listeners=[
-                    f"{self._uuid}|select",
-                    f"{self._uuid}|first",
-                    f"{self._uuid}|back",
-                    f"{self._uuid}|callback",
-                    f"{self._uuid}|next",
-                    f"{self._uuid}|last",
-                ],
-            )
+        self._cid_prefix = f"{self._uuid}|"
+        self._last = len(self.pages) - 1
+        self._emoji_dicts = {
+            "first": _process_button_emoji(self.first_button_emoji),
+            "back": _process_button_emoji(self.back_button_emoji),
+            "callback": _process_button_emoji(self.callback_button_emoji),
+            "next": _process_button_emoji(self.next_button_emoji),
+            "last": _process_button_emoji(self.last_button_emoji),
+        }
+        self._page_revision = Page._revision
+        if self.show_select_menu:
+            self._select_options = self._build_select_options()
+
+        self._command = ComponentCommand(
+            name=f"Paginator:{self._uuid}", callback=Paginator._dispatch, listeners=self._listeners
         )
+        self._register()
 
     @property
     def message(self) -> Message:
@@ -195,13 +319,23 @@ class Paginator:
         Returns:
             A paginator system
         """
-        content_pages = textwrap.wrap(
-            content,
-            width=page_size - (len(prefix) + len(suffix)),
-            break_long_words=True,
-            break_on_hyphens=False,
-            replace_whitespace=False,
-        )
+        import textwrap
+
+        # account for the newlines `Page.to_embed` places around the content
+        width = page_size - (len(prefix) + len(suffix) + 2)
+        if width < 1:
+            raise ValueError("page_size is too small to fit the prefix and suffix")
+        if max(map(len, content.split()), default=0) <= width:
+            content_pages = textwrap.wrap(
+                content,
+                width=width,
+                break_long_words=True,
+                break_on_hyphens=False,
+                replace_whitespace=False,
+            )
+        else:
+            # textwrap degrades badly on long unbroken runs, so slice those directly
+            content_pages = _chunk_string(content, width)
         pages = [Page(c, prefix=prefix, suffix=suffix) for c in content_pages]
         return cls(client, pages=pages, timeout_interval=timeout)
 
@@ -230,17 +364,52 @@ class Paginator:
             A paginator system
         """
         pages = []
-        page = ""
+        buffer: list[str] = []
+        buffer_len = 0
         for entry in content:
-            if len(page) + len(f"\n{entry}") <= page_size:
-                page += f"{entry}\n"
-            else:
-                pages.append(Page(page, prefix=prefix, suffix=suffix))
-                page = ""
-        if page != "":
-            pages.append(Page(page, prefix=prefix, suffix=suffix))
+            entry_len = len(entry) + 1
+            if buffer and buffer_len + entry_len > page_size:
+                pages.append(Page("".join(buffer), prefix=prefix, suffix=suffix))
+                buffer.clear()
+                buffer_len = 0
+            buffer.append(entry)
+            buffer.append("\n")
+            buffer_len += entry_len
+        if buffer:
+            pages.append(Page("".join(buffer), prefix=prefix, suffix=suffix))
         return cls(client, pages=pages, timeout_interval=timeout)
 
+    def _build_select_options(self) -> List[SelectOption]:
+        """Build the select menu options for every page."""
+        return [
+            SelectOption(f"{i+1} {p.get_summary if isinstance(p, Page) else p.title}", str(i))
+            for i, p in enumerate(self.pages)
+        ]
+
+    def _sync_page_revision(self) -> None:
+        """Drop output built from page summaries if any `Page` has been edited since it was built."""
+        if self._page_revision != Page._revision:
+            self._page_revision = Page._revision
+            self._select_options = None
+            self._select_option_dicts = None
+            self._components_dict_cache.clear()
+
+    def _button_layout(self, disable: bool) -> list[tuple[str, bool]]:
+        """Get the `(action, disabled)` state of each button shown on the current page, in display order."""
+        at_start = self.page_index == 0
+        at_end = self.page_index >= self._last
+        return [
+            (action, disable or at_edge)
+            for action, shown, at_edge in (
+                ("first", self.show_first_button, at_start),
+                ("back", self.show_back_button, at_start),
+                ("callback", self.show_callback_button, False),
+                ("next", self.show_next_button, at_end),
+                ("last", self.show_last_button, at_end),
+            )
+            if shown
+        ]
+
     def create_components(self, disable: bool = False) -> List[ActionRow]:
         """
         Create the components for the paginator message.
@@ -252,87 +421,117 @@ class Paginator:
             A list of ActionRows
 
         """
-        output = []
+        self._sync_page_revision()
+        rows = []
 
         if self.show_select_menu:
+            if self._select_options is None:
+                self._select_options = self._build_select_options()
             current = self.pages[self.page_index]
-            output.append(
-                Select(
-                    [
-                        SelectOption(f"{i+1} {p.get_summary if isinstance(p, Page) else p.title}", str(i))
-                        for i, p in enumerate(self.pages)
-                    ],
-                    custom_id=f"{self._uuid}|select",
-                    placeholder=f"{self.page_index+1} {current.get_summary if isinstance(current, Page) else current.title}",
-                    max_values=1,
-                    disabled=disable,
+            rows.append(
+                ActionRow(
+                    Select(
+                        self._select_options,
+                        custom_id=self._cid_prefix + "select",
+                        placeholder=f"{self.page_index+1} {current.get_summary if isinstance(current, Page) else current.title}",
+                        max_values=1,
+                        disabled=disable,
+                    )
                 )
             )
 
-        if self.show_first_button:
-            output.append(
-                Button(
-                    self.default_button_color,
-                    emoji=self.first_button_emoji,
-                    custom_id=f"{self._uuid}|first",
-                    disabled=disable or self.page_index == 0,
-                )
-            )
-        if self.show_back_button:
-            output.append(
-                Button(
-                    self.default_button_color,
-                    emoji=self.back_button_emoji,
-                    custom_id=f"{self._uuid}|back",
-                    disabled=disable or self.page_index == 0,
-                )
-            )
-
-        if self.show_callback_button:
-            output.append(
-                Button(
-                    self.default_button_color,
-                    emoji=self.callback_button_emoji,
-                    custom_id=f"{self._uuid}|callback",
-                    disabled=disable,
-                )
+        if buttons := [
+            Button(
+                self.default_button_color,
+                emoji=getattr(self, f"{action}_button_emoji"),
+                custom_id=self._cid_prefix + action,
+                disabled=disabled,
             )
+            for action, disabled in self._button_layout(disable)
+        ]:
+            rows.append(ActionRow(*buttons))
 
-        if self.show_next_button:
-            output.append(
-                Button(
-                    self.default_button_color,
-                    emoji=self.next_button_emoji,
-                    custom_id=f"{self._uuid}|next",
-                    disabled=disable or self.page_index >= len(self.pages) - 1,
-                )
-            )
-        if self.show_last_button:
-            output.append(
-                Button(
-                    self.default_button_color,
-                    emoji=self.last_button_emoji,
-                    custom_id=f"{self._uuid}|last",
-                    disabled=disable or self.page_index >= len(self.pages) - 1,
-                )
-            )
+        return rows
 
-        return spread_to_rows(*output)
-
-    def to_dict(self) -> dict:
-        """Convert this paginator into a dictionary for sending."""
-        page = self.pages[self.page_index]
+    def _build_embed_dict(self, index: int) -> dict:
+        """Serialise the page at `index` into an embed dictionary."""
+        page = self.pages[index]
 
         if isinstance(page, Page):
-            page = page.to_embed()
-            if not page.title and self.default_title:
-                page.title = self.default_title
+            # the page number depends on this paginator, so the footer is kept out of the page's cache
+            data = page.to_embed_dict(self.default_title, self.default_color)
+            return data | {"footer": {"text": f"Page {index+1}/{len(self.pages)}"}}
+
         if not page.footer:
-            page.set_footer(f"Page {self.page_index+1}/{len(self.pages)}")
+            page.set_footer(f"Page {index+1}/{len(self.pages)}")
         if not page.color:
             page.color = self.default_color
 
-        return {"embeds": [page.to_dict()], "components": [c.to_dict() for c in self.create_components()]}
+        return page.to_dict()
+
+    def _build_components_payload(self, disable: bool = False) -> list[dict]:
+        """
+        Build the serialised components for the current page.
+
+        This produces the same payload as serialising `create_components`, without constructing any component objects.
+
+        Args:
+            disable: Should all the components be disabled?
+
+        Returns:
+            A list of action row dictionaries
+
+        """
+        rows = []
+
+        if self.show_select_menu:
+            if self._select_option_dicts is None:
+                if self._select_options is None:
+                    self._select_options = self._build_select_options()
+                self._select_option_dicts = [o.to_dict() for o in self._select_options]
+            current = self.pages[self.page_index]
+            select = {
+                "options": self._select_option_dicts,
+                "custom_id": self._cid_prefix + "select",
+                "placeholder": f"{self.page_index+1} {current.get_summary if isinstance(current, Page) else current.title}",
+                "min_values": 1,
+                "max_values": 1,
+                "disabled": disable,
+                "type": ComponentTypes.SELECT,
+            }
+            rows.append({"components": [select], "type": ComponentTypes.ACTION_ROW})
+
+        buttons = []
+        for action, disabled in self._button_layout(disable):
+            button = {
+                "style": self.default_button_color,
+                "custom_id": self._cid_prefix + action,
+                "disabled": disabled,
+                "type": ComponentTypes.BUTTON,
+            }
+            if emoji := self._emoji_dicts[action]:
+                button["emoji"] = emoji
+            buttons.append(button)
+        if buttons:
+            rows.append({"components": buttons, "type": ComponentTypes.ACTION_ROW})
+
+        return rows
+
+    def _components_dict(self, disable: bool = False) -> list[dict]:
+        """Get the serialised components for the current page."""
+        self._sync_page_revision()
+        key = (self.page_index, disable)
+        if (components := self._components_dict_cache.get(key)) is None:
+            components = self._components_dict_cache[key] = self._build_components_payload(disable)
+        return components
+
+    def _payload(self) -> dict:
+        """Get the message payload for the current page. Parts of this are cached, so it must not be modified."""
+        return {"embeds": [self._build_embed_dict(self.page_index)], "components": self._components_dict()}
+
+    def to_dict(self) -> dict:
+        """Convert this paginator into a dictionary for sending."""
+        return copy.deepcopy(self._payload())
 
     async def send(self, ctx: Context) -> Message:
         """
@@ -345,12 +544,13 @@ class Paginator:
             The resulting message
 
         """
-        self._message = await ctx.send(**self.to_dict())
+        if self._uuid not in Paginator._registry:
+            # stopped or timed out since it was last sent
+            self._register()
+        self._message = await ctx.send(**self._payload())
         self._author_id = ctx.author.id
 
-        if self.timeout_interval > 1:
-            self._timeout_task = Timeout(self)
-            asyncio.create_task(self._timeout_task())
+        self._start_timeout()
 
         return self._message
 
@@ -363,21 +563,105 @@ class Paginator:
         Returns:
             The resulting message
         """
-        self._message = await ctx.reply(**self.to_dict())
+        if self._uuid not in Paginator._registry:
+            # stopped or timed out since it was last sent
+            self._register()
+        self._message = await ctx.reply(**self._payload())
         self._author_id = ctx.author.id
 
-        if self.timeout_interval > 1:
-            self._timeout_task = Timeout(self)
-            asyncio.create_task(self._timeout_task())
+        self._start_timeout()
 
         return self._message
 
+    @property
+    def _listeners(self) -> list[str]:
+        return [self._cid_prefix + action for action in ("select", "first", "back", "callback", "next", "last")]
+
+    def _register(self) -> None:
+        """Route this paginator's components to the shared dispatcher."""
+        self.client.add_component_callback(self._command)
+        Paginator._registry[self._uuid] = self
+
+    def _deregister(self) -> None:
+        """Stop routing this paginator's components, allowing it to be garbage collected."""
+        self.client.remove_component_callback(self._command)
+        Paginator._registry.pop(self._uuid, None)
+
+    @classmethod
+    async def _dispatch(cls, ctx: ComponentContext, *args, **kwargs) -> Optional[Message]:
+        """Forward a component interaction to the paginator that owns it."""
+        paginator = cls._registry.get(ctx.custom_id.partition("|")[0])
+        if paginator is not None:
+            return await paginator._on_button(ctx, *args, **kwargs)
+
+    def _start_timeout(self) -> None:
+        """
+        Add this paginator to the shared expiry heap, superseding any previous entry.
+
+        Paginators without a timeout allocate nothing here, and those with one only schedule a timer callback.
+
+        """
+        if self.timeout_interval <= 1:
+            return
+        loop = asyncio.get_running_loop()
+        self._deadline = loop.time() + self.timeout_interval
+        self._expiry_entry = next(Paginator._expiry_counter)
+        heapq.heappush(Paginator._expiry_heap, (self._deadline, self._expiry_entry, self))
+        Paginator._schedule_next(loop)
+
+    @classmethod
+    def _schedule_next(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Ensure the expiry timer is set for the earliest deadline in the heap."""
+        if cls._expiry_handle:
+            if cls._expiry_heap and cls._expiry_handle.when() == cls._expiry_heap[0][0]:
+                return
+            cls._expiry_handle.cancel()
+            cls._expiry_handle = None
+        if cls._expiry_heap:
+            cls._expiry_handle = loop.call_at(cls._expiry_heap[0][0], cls._fire_expired, loop)
+
+    @classmethod
+    def _fire_expired(cls, loop: asyncio.AbstractEventLoop) -> None:
+        """Disable every paginator whose deadline has passed, then re-arm the timer."""
+        cls._expiry_handle = None
+        now = loop.time()
+        heap = cls._expiry_heap
+
+        while heap and heap[0][0] <= now:
+            _, entry, paginator = heapq.heappop(heap)
+            if entry != paginator._expiry_entry:
+                # stopped, or superseded by a newer entry
+                continue
+            if paginator._deadline > now:
+                # the paginator was used since this entry was pushed
+                heapq.heappush(heap, (paginator._deadline, entry, paginator))
+                continue
+            paginator._expiry_entry = None
+            paginator._deregister()
+            if paginator.message:
+                # only expired paginators ever get a task, and only for the edit itself
+                task = loop.create_task(paginator._disable_message())
+                cls._disable_tasks.add(task)
+                task.add_done_callback(cls._disable_tasks.discard)
+
+        cls._schedule_next(loop)
+
     async def stop(self) -> None:
         """Disable this paginator."""
-        if self._timeout_task:
-            self._timeout_task.run = False
-            self._timeout_task.ping.set()
-        await self._message.edit(components=self.create_components(True))
+        # lazily removed from the heap once its entry is popped
+        self._expiry_entry = None
+        self._deregister()
+        if self._message is MISSING:
+            return
+        # shielded so a cancelled caller can't abandon the edit halfway
+        await asyncio.shield(self._disable_message())
+
+    async def _disable_message(self) -> None:
+        """Edit the message to show disabled components, ignoring messages that are gone or no longer editable."""
+        try:
+            await self._message.edit(components=self._components_dict(True))
+        except (NotFound, Forbidden):
+            pass
 
     async def update(self) -> None:
         """
@@ -386,33 +670,64 @@ class Paginator:
         Use this if you have programmatically changed the page_index
 
         """
-        await self._message.edit(**self.to_dict())
+        await self._message.edit(**self._payload())
+
+    async def _edit_coalesced(self, ctx: ComponentContext) -> None:
+        """
+        Show the current page in response to `ctx`, coalescing clicks that arrive while an edit is in flight.
+
+        Clicks received during an edit are only deferred; once the in-flight edit completes, the latest of them is
+        used to send the state the paginator has reached. Rapid clicks therefore cost two edits instead of one each.
+        If the in-flight edit fails, the pending click is still used to send the latest page before the error is raised.
+
+        Args:
+            ctx: The context of the click to respond to
+
+        """
+        if self._editing:
+            await ctx.defer(edit_origin=True)
+            if self._editing:
+                self._pending_ctx = ctx
+                return
+            # the in-flight edit finished while we were deferring, so nothing will pick this click up
+
+        self._editing = True
+        error = None
+        sent = self.page_index
+        try:
+            await ctx.edit_origin(**self._payload())
+        except Exception as e:
+            # clicks deferred meanwhile still need the latest page sent, so only raise once they've been handled
+            error = e
+            sent = None
+
+        try:
+            while (pending := self._pending_ctx) is not None:
+                self._pending_ctx = None
+                if self.page_index != sent:
+                    sent = self.page_index
+                    await pending.edit_origin(**self._payload())
+        finally:
+            self._editing = False
+            self._pending_ctx = None
+
+        if error is not None:
+            raise error
 
     async def _on_button(self, ctx: ComponentContext, *args, **kwargs) -> Optional[Message]:
-        if ctx.author.id == self.author_id:
-            if self._timeout_task:
-                self._timeout_task.ping.set()
-            match ctx.custom_id.split("|")[1]:
-                case "first":
-                    self.page_index = 0
-                case "last":
-                    self.page_index = len(self.pages) - 1
-                case "next":
-                    if (self.page_index + 1) < len(self.pages):
-                        self.page_index += 1
-                case "back":
-                    if (self.page_index - 1) >= 0:
-                        self.page_index -= 1
-                case "select":
-                    self.page_index = int(ctx.values[0])
-                case "callback":
-                    if self.callback:
-                        return await self.callback(ctx)
-
-            await ctx.edit_origin(**self.to_dict())
-        else:
+        if ctx.author.id != self.author_id:
             if self.wrong_user_message:
                 return await ctx.send(self.wrong_user_message, ephemeral=True)
-            else:
-                # silently ignore
-                return await ctx.defer(edit_origin=True)
+            # silently ignore, leaving the interaction unanswered rather than spending a request on it
+            return None
+
+        if self._expiry_entry is not None:
+            self._deadline = asyncio.get_running_loop().time() + self.timeout_interval
+        key = ctx.custom_id.rpartition("|")[2]
+        if key == "callback":
+            if self.callback:
+                return await self.callback(ctx)
+        elif action := _PAGE_ACTIONS.get(key):
+            self.page_index = action(self, ctx)
+
+        await self._edit_coalesced(ctx)
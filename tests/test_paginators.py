@@ -0,0 +1,319 @@
+import asyncio
+
+import pytest
+
+from naff import MISSING, Embed
+from naff.client.client import Client
+from naff.ext.paginators import Page, Paginator, _chunk_string
+from naff.models.discord.color import Color
+
+__all__ = ()
+
+
+@pytest.fixture()
+def bot() -> Client:
+    return Client()
+
+
+def test_chunk_string_breaks_on_whitespace() -> None:
+    assert _chunk_string("abc def ghi", 7) == ["abc def", "ghi"]
+    assert _chunk_string("line1\nline2\n" + "x" * 20, 8) == ["line1", "line2", "xxxxxxxx", "xxxxxxxx", "xxxx"]
+    assert _chunk_string("a\tbcdefgh", 4) == ["a", "bcde", "fgh"]
+
+
+def test_chunk_string_hard_cuts_long_tokens() -> None:
+    assert _chunk_string("x" * 10, 4) == ["xxxx", "xxxx", "xx"]
+    assert _chunk_string("", 4) == []
+    assert _chunk_string("   ", 4) == []
+
+
+def test_chunk_string_invalid_width() -> None:
+    with pytest.raises(ValueError):
+        _chunk_string("abc def", 0)
+
+
+def test_create_from_string(bot: Client) -> None:
+    paginator = Paginator.create_from_string(bot, "abc def ghi", page_size=9)
+    assert [p.content for p in paginator.pages] == ["abc def", "ghi"]
+
+    paginator = Paginator.create_from_string(bot, "line1\n" + "x" * 20, page_size=10)
+    assert [p.content for p in paginator.pages] == ["line1", "xxxxxxxx", "xxxxxxxx", "xxxx"]
+    assert all(len(p.to_embed().description) <= 10 for p in paginator.pages)
+
+
+def test_create_from_string_page_size_too_small(bot: Client) -> None:
+    with pytest.raises(ValueError):
+        Paginator.create_from_string(bot, "abc def", page_size=2)
+
+
+def test_create_from_list_keeps_every_entry(bot: Client) -> None:
+    entries = [f"entry {i}" for i in range(50)]
+    paginator = Paginator.create_from_list(bot, entries, page_size=30)
+
+    assert len(paginator.pages) > 1
+    assert all(len(p.content) <= 30 for p in paginator.pages)
+    assert [line for p in paginator.pages for line in p.content.splitlines()] == entries
+
+
+def test_page_summary_follows_changes() -> None:
+    page = Page("old content")
+    assert page.get_summary == "old content"
+
+    page.content = "new content"
+    assert page.get_summary == "new content"
+
+    page.title = "A title"
+    assert page.get_summary == "A title"
+
+
+def test_page_embed_dict_follows_changes(bot: Client) -> None:
+    paginator = Paginator(bot, pages=[Page("old")])
+    assert "old" in paginator.to_dict()["embeds"][0]["description"]
+
+    paginator.pages[0].content = "new"
+    assert "new" in paginator.to_dict()["embeds"][0]["description"]
+
+
+def test_embed_page_edits_are_sent(bot: Client) -> None:
+    embed = Embed(title="old")
+    paginator = Paginator.create_from_embeds(bot, embed)
+    assert paginator.to_dict()["embeds"][0]["title"] == "old"
+
+    embed.title = "new"
+    assert paginator.to_dict()["embeds"][0]["title"] == "new"
+
+
+def test_to_dict_returns_fresh_containers(bot: Client) -> None:
+    paginator = Paginator(bot, pages=[Page("content")])
+    data = paginator.to_dict()
+    data["embeds"][0]["title"] = "changed"
+    data["components"].append({})
+    data["components"][0]["components"][0]["emoji"]["name"] = "X"
+
+    fresh = paginator.to_dict()
+    assert "title" not in fresh["embeds"][0]
+    assert len(fresh["components"]) == 1
+    assert fresh["components"][0]["components"][0]["emoji"]["name"] == "⏮️"
+
+
+def test_page_embed_dict_cache_keys_on_color_value() -> None:
+    page = Page("content")
+    page.to_embed_dict(default_color=Color("#123456"))
+    page.to_embed_dict(default_color=Color("#123456"))
+    assert len(page._embed_dict_cache) == 1
+
+
+async def test_paginator_resend_after_stop(bot: Client) -> None:
+    paginator = Paginator.create_from_string(bot, "abc def", page_size=6)
+    listener = f"{paginator._uuid}|next"
+    assert listener in bot._component_callbacks
+
+    await paginator.stop()
+    assert listener not in bot._component_callbacks
+
+    class FakeContext:
+        author = type("Author", (), {"id": 1})()
+
+        async def send(self, **kwargs) -> str:
+            return "message"
+
+    await paginator.send(FakeContext())
+    assert listener in bot._component_callbacks
+
+
+class FakeHandle:
+    def __init__(self, when: float) -> None:
+        self._when = when
+        self.cancelled = False
+
+    def when(self) -> float:
+        return self._when
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FakeTask:
+    def add_done_callback(self, callback) -> None:
+        pass
+
+
+class FakeLoop:
+    """A loop with a manually controlled clock, that runs created tasks to completion immediately."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def call_at(self, when: float, callback, *args) -> FakeHandle:
+        return FakeHandle(when)
+
+    def create_task(self, coro) -> FakeTask:
+        run_sync(coro)
+        return FakeTask()
+
+
+class FakeMessage:
+    def __init__(self) -> None:
+        self.edits = []
+
+    async def edit(self, **kwargs) -> None:
+        self.edits.append(kwargs)
+
+
+def run_sync(coro) -> None:
+    """Run a coroutine that never suspends."""
+    with pytest.raises(StopIteration):
+        coro.send(None)
+
+
+@pytest.fixture()
+def loop(monkeypatch) -> FakeLoop:
+    loop = FakeLoop()
+    monkeypatch.setattr(asyncio, "get_running_loop", lambda: loop)
+    monkeypatch.setattr(Paginator, "_expiry_heap", [])
+    monkeypatch.setattr(Paginator, "_expiry_handle", None)
+    return loop
+
+
+def timed_paginator(bot: Client) -> Paginator:
+    paginator = Paginator.create_from_list(bot, ["a", "b"], page_size=2, timeout=10)
+    paginator._message = FakeMessage()
+    paginator._start_timeout()
+    return paginator
+
+
+def test_expiry_repushes_used_paginators(bot: Client, loop: FakeLoop) -> None:
+    paginator = timed_paginator(bot)
+    assert Paginator._expiry_handle.when() == 10
+
+    # a click at t=5 moves the deadline without touching the heap
+    loop.now = 5
+    paginator._deadline = loop.time() + paginator.timeout_interval
+
+    loop.now = 10
+    Paginator._fire_expired(loop)
+    assert paginator.message.edits == []
+    assert Paginator._expiry_heap[0][0] == 15
+    assert Paginator._expiry_handle.when() == 15
+
+
+def test_expiry_disables_and_deregisters(bot: Client, loop: FakeLoop) -> None:
+    paginator = timed_paginator(bot)
+    listener = f"{paginator._uuid}|next"
+
+    loop.now = 10
+    Paginator._fire_expired(loop)
+    assert paginator.message.edits == [{"components": paginator._components_dict(True)}]
+    assert listener not in bot._component_callbacks
+    assert paginator._expiry_entry is None
+    assert Paginator._expiry_heap == []
+    assert Paginator._expiry_handle is None
+
+
+def test_stop_invalidates_expiry(bot: Client, loop: FakeLoop) -> None:
+    paginator = timed_paginator(bot)
+    # detach the message so stop() doesn't need a running loop to edit it
+    message, paginator._message = paginator._message, MISSING
+    run_sync(paginator.stop())
+    paginator._message = message
+
+    loop.now = 10
+    Paginator._fire_expired(loop)
+    assert message.edits == []
+    assert Paginator._expiry_heap == []
+
+
+@pytest.mark.parametrize("disable", [False, True])
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"show_select_menu": True},
+        {"show_callback_button": True},
+        {"show_first_button": False, "show_last_button": False},
+        {"show_select_menu": True, "show_back_button": False, "show_next_button": False},
+    ],
+)
+def test_components_payload_matches_components(bot: Client, options: dict, disable: bool) -> None:
+    pages = [Page("first page"), Page("second page", title="Second"), Page("third page")]
+    paginator = Paginator(bot, pages=pages, page_index=1, **options)
+
+    assert paginator._build_components_payload(disable) == [c.to_dict() for c in paginator.create_components(disable)]
+
+
+class FakeComponentContext:
+    def __init__(self, log: list, action: str, paginator: Paginator, fail: bool = False) -> None:
+        self.log = log
+        self.author = type("Author", (), {"id": 1})()
+        self.custom_id = f"{paginator._uuid}|{action}"
+        self.values = []
+        self.fail = fail
+
+    async def defer(self, edit_origin: bool = False) -> None:
+        await asyncio.sleep(0)
+        self.log.append(("defer", None))
+
+    async def edit_origin(self, **kwargs) -> None:
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("edit failed")
+        self.log.append(("edit", kwargs["embeds"][0]["footer"]["text"]))
+
+
+def clicking_paginator(bot: Client) -> Paginator:
+    paginator = Paginator.create_from_list(bot, [str(i) for i in range(10)], page_size=2)
+    paginator._author_id = 1
+    return paginator
+
+
+async def test_rapid_clicks_are_coalesced(bot: Client) -> None:
+    paginator = clicking_paginator(bot)
+    log = []
+    contexts = [FakeComponentContext(log, "next", paginator) for _ in range(5)]
+
+    await asyncio.gather(*(paginator._on_button(ctx) for ctx in contexts))
+
+    assert paginator.page_index == 5
+    assert [entry for entry in log if entry[0] == "edit"] == [("edit", "Page 2/10"), ("edit", "Page 6/10")]
+    assert len([entry for entry in log if entry[0] == "defer"]) == 4
+    assert not paginator._editing
+
+
+async def test_failed_edit_still_sends_pending_click(bot: Client) -> None:
+    paginator = clicking_paginator(bot)
+    log = []
+    first = FakeComponentContext(log, "next", paginator, fail=True)
+    second = FakeComponentContext(log, "next", paginator)
+
+    results = await asyncio.gather(paginator._on_button(first), paginator._on_button(second), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert log == [("defer", None), ("edit", "Page 3/10")]
+    assert not paginator._editing
+
+
+def test_select_menu_follows_page_edits(bot: Client) -> None:
+    paginator = Paginator(bot, pages=[Page("old one"), Page("two")], show_select_menu=True)
+    select = paginator.to_dict()["components"][0]["components"][0]
+    assert select["options"][0]["label"] == "1 old one"
+    assert select["placeholder"] == "1 old one"
+
+    paginator.pages[0].content = "new one"
+    select = paginator.to_dict()["components"][0]["components"][0]
+    assert select["options"][0]["label"] == "1 new one"
+    assert select["placeholder"] == "1 new one"
+    assert paginator.create_components()[0].components[0].placeholder == "1 new one"
+
+
+def test_default_emojis_are_not_shared(bot: Client) -> None:
+    paginator = Paginator(bot, pages=[Page("content")])
+    assert paginator.first_button_emoji == "⏮️"
+
+    paginator.to_dict()["components"][0]["components"][0]["emoji"]["name"] = "X"
+
+    fresh = Paginator(bot, pages=[Page("content")])
+    assert fresh.to_dict()["components"][0]["components"][0]["emoji"]["name"] == "⏮️"
+    assert fresh.create_components()[0].components[0].emoji == "⏮️"